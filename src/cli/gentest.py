@@ -54,14 +54,19 @@ Limitations:
 import json
 import os
 from dataclasses import asdict, dataclass
+from functools import cache
+from string import Template
 from sys import stderr
-from typing import Dict, List, TextIO
+from typing import TYPE_CHECKING, Any, Dict, List, TextIO, Tuple
 
 import click
 
-from ethereum_test_base_types import Account, Address, Hash, ZeroPaddedHexNumber
-from ethereum_test_tools.rpc import BlockNumberType, DebugRPC, EthRPC
-from ethereum_test_types import Transaction
+# Heavy imports (requests, pydantic-based test types) are deferred to the
+# functions that need them to keep CLI startup (e.g. `gentest --help`) fast.
+if TYPE_CHECKING:
+    from ethereum_test_base_types import Account, Address, Hash
+    from ethereum_test_tools.rpc import BlockNumberType
+    from ethereum_test_types import Transaction
 
 
 @click.command()
@@ -83,6 +88,8 @@ def make_test(transaction_hash: str, output_file: TextIO, config_file: TextIO):
 
     OUTPUT_FILE is the path to the output python script.
     """
+    from ethereum_test_base_types import Hash
+
     print("Load configs...", file=stderr)
     config = Config(config_file)
     request = RequestManager(config.remote_nodes[0])
@@ -93,11 +100,8 @@ def make_test(transaction_hash: str, output_file: TextIO, config_file: TextIO):
     )
     tr = request.eth_get_transaction_by_hash(Hash(transaction_hash))
 
-    print("Perform debug_trace_call", file=stderr)
-    state = request.debug_trace_call(tr)
-
-    print("Perform eth_get_block_by_number", file=stderr)
-    block = request.eth_get_block_by_number(tr.block_number)
+    print("Perform batched debug_trace_call + eth_get_block_by_number", file=stderr)
+    state, block = request.debug_trace_call_with_block(tr)
 
     print("Generate py test", file=stderr)
     constructor = TestConstructor(PYTEST_TEMPLATE)
@@ -108,119 +112,129 @@ def make_test(transaction_hash: str, output_file: TextIO, config_file: TextIO):
     print("Finished", file=stderr)
 
 
+@cache
+def zero_padded_hex(value: str | int) -> str:
+    """
+    Format a value as a zero-padded hex string, caching repeated values.
+
+    Prestate dumps repeat the same balances, nonces and storage words many
+    times, so formatting each distinct value once is a cheap win.
+    """
+    from ethereum_test_base_types import ZeroPaddedHexNumber
+
+    return str(ZeroPaddedHexNumber(value))
+
+
+QUOTED_TRANSACTION_FIELDS = frozenset(["data", "to"])
+HEX_TRANSACTION_FIELDS = frozenset(["v", "r", "s"])
+LEGACY_TRANSACTION_FIELDS = frozenset(
+    [
+        "ty",
+        "chain_id",
+        "nonce",
+        "gas_price",
+        "protected",
+        "gas_limit",
+        "value",
+    ]
+)
+
+
 class TestConstructor:
     """
     Construct .py file from test template, by replacing keywords with test data
     """
 
-    test_template: str
+    test_template: Template
 
-    def __init__(self, test_template: str):
+    def __init__(self, test_template: Template):
         """
         Initialize with template
         """
         self.test_template = test_template
 
-    def _make_test_comments(self, test: str, tr_hash: str) -> str:
-        test = test.replace(
-            "$HEADLINE_COMMENT",
-            "gentest autogenerated test with debug_traceCall of tx.hash " + tr_hash,
-        )
-        test = test.replace("$TEST_NAME", "test_transaction_" + tr_hash[2:])
-        test = test.replace(
-            "$TEST_COMMENT", "gentest autogenerated test for tx.hash " + tr_hash[2:]
-        )
-        return test
-
-    def _make_test_environment(self, test: str, bl: "RequestManager.RemoteBlock") -> str:
-        env_str = ""
+    def _make_test_environment(self, bl: "RequestManager.RemoteBlock") -> str:
         pad = "        "
-        for field, value in asdict(bl).items():
-            env_str += (
-                f'{pad}{field}="{value}",\n' if field == "coinbase" else f"{pad}{field}={value},\n"
-            )
-        test = test.replace("$ENV", env_str)
-        return test
+        return "".join(
+            f'{pad}{field}="{value}",\n' if field == "coinbase" else f"{pad}{field}={value},\n"
+            for field, value in asdict(bl).items()
+        )
 
     def _make_pre_state(
-        self, test: str, tr: "RequestManager.RemoteTransaction", state: Dict[Address, Account]
+        self, tr: "RequestManager.RemoteTransaction", state: "Dict[Address, Account]"
     ) -> str:
+        from ethereum_test_base_types import Bytes
+
         # Print a nice .py storage pre
         pad = "            "
-        state_str = ""
+        state_parts: List[str] = []
         for address, account in state.items():
             if isinstance(account, dict):
-                account_obj = Account(**account)
-                state_str += f'        "{address}": Account(\n'
-                state_str += f"{pad}balance={str(account_obj.balance)},\n"
+                # Only a handful of fields are read here, so convert them
+                # directly instead of paying for a full `Account` validation.
+                balance = zero_padded_hex(account.get("balance", 0))
+                state_parts.append(f'        "{address}": Account(\n')
+                state_parts.append(f"{pad}balance={balance},\n")
                 if address == tr.transaction.sender:
-                    state_str += f"{pad}nonce={tr.transaction.nonce},\n"
+                    state_parts.append(f"{pad}nonce={tr.transaction.nonce},\n")
                 else:
-                    state_str += f"{pad}nonce={str(account_obj.nonce)},\n"
+                    nonce = zero_padded_hex(account.get("nonce", 0))
+                    state_parts.append(f"{pad}nonce={nonce},\n")
 
-                if account_obj.code is None:
-                    state_str += f'{pad}code="0x",\n'
+                code = account.get("code")
+                if code is None:
+                    state_parts.append(f'{pad}code="0x",\n')
                 else:
-                    state_str += f'{pad}code="{str(account_obj.code)}",\n'
-                state_str += pad + "storage={\n"
+                    state_parts.append(f'{pad}code="{Bytes(code)}",\n')
+                state_parts.append(pad + "storage={\n")
 
-                if account_obj.storage is not None:
-                    for record, value in account_obj.storage.root.items():
-                        pad_record = ZeroPaddedHexNumber(record)
-                        pad_value = ZeroPaddedHexNumber(value)
-                        state_str += f'{pad}    "{pad_record}" : "{pad_value}",\n'
+                for record, value in account.get("storage", {}).items():
+                    pad_record = zero_padded_hex(record)
+                    pad_value = zero_padded_hex(value)
+                    state_parts.append(f'{pad}    "{pad_record}" : "{pad_value}",\n')
 
-                state_str += pad + "}\n"
-                state_str += "        ),\n"
-        return test.replace("$PRE", state_str)
+                state_parts.append(pad + "}\n")
+                state_parts.append("        ),\n")
+        return "".join(state_parts)
 
-    def _make_transaction(self, test: str, tr: "RequestManager.RemoteTransaction") -> str:
+    def _make_transaction(self, tr: "RequestManager.RemoteTransaction") -> str:
         """
         Print legacy transaction in .py
         """
         pad = "            "
-        tr_str = ""
-        quoted_fields_array = ["data", "to"]
-        hex_fields_array = ["v", "r", "s"]
-        legacy_fields_array = [
-            "ty",
-            "chain_id",
-            "nonce",
-            "gas_price",
-            "protected",
-            "gas_limit",
-            "value",
-        ]
+        tr_parts: List[str] = []
         for field, value in iter(tr.transaction):
             if value is None:
                 continue
 
-            if field in legacy_fields_array:
-                tr_str += f"{pad}{field}={value},\n"
-
-            if field in quoted_fields_array:
-                tr_str += f'{pad}{field}="{value}",\n'
+            if field in LEGACY_TRANSACTION_FIELDS:
+                tr_parts.append(f"{pad}{field}={value},\n")
+            elif field in QUOTED_TRANSACTION_FIELDS:
+                tr_parts.append(f'{pad}{field}="{value}",\n')
+            elif field in HEX_TRANSACTION_FIELDS:
+                tr_parts.append(f"{pad}{field}={hex(value)},\n")
 
-            if field in hex_fields_array:
-                tr_str += f"{pad}{field}={hex(value)},\n"
-
-        return test.replace("$TR", tr_str)
+        return "".join(tr_parts)
 
     def make_test_template(
         self,
         bl: "RequestManager.RemoteBlock",
         tr: "RequestManager.RemoteTransaction",
-        state: Dict[Address, Account],
+        state: "Dict[Address, Account]",
     ) -> str:
         """
         Prepare the .py file template
         """
-        test = self.test_template
-        test = self._make_test_comments(test, str(tr.tr_hash))
-        test = self._make_test_environment(test, bl)
-        test = self._make_pre_state(test, tr, state)
-        test = self._make_transaction(test, tr)
-        return test
+        tr_hash = str(tr.tr_hash)
+        return self.test_template.substitute(
+            HEADLINE_COMMENT="gentest autogenerated test with debug_traceCall of tx.hash "
+            + tr_hash,
+            TEST_NAME="test_transaction_" + tr_hash[2:],
+            TEST_COMMENT="gentest autogenerated test for tx.hash " + tr_hash[2:],
+            ENV=self._make_test_environment(bl),
+            PRE=self._make_pre_state(tr, state),
+            TR=self._make_transaction(tr),
+        )
 
 
 class Config:
@@ -238,6 +252,13 @@ class Config:
         node_url: str
         client_id: str
         secret: str
+        batch_size: int = 10
+        """
+        Maximum number of requests allowed in a single JSON-RPC batch.
+
+        Kept conservative by default because some providers cap batches at
+        10 items.
+        """
 
     remote_nodes: List["Config.RemoteNode"]
 
@@ -261,8 +282,8 @@ class RequestManager:
         """
 
         block_number: int
-        tr_hash: Hash
-        transaction: Transaction
+        tr_hash: "Hash"
+        transaction: "Transaction"
 
     @dataclass
     class RemoteBlock:
@@ -283,18 +304,58 @@ class RequestManager:
         """
         Initialize the RequestManager with specific client config.
         """
+        import requests
+
+        from ethereum_test_tools.rpc import DebugRPC, EthRPC
+
         self.node_url = node_config.node_url
         headers = {
             "CF-Access-Client-Id": node_config.client_id,
             "CF-Access-Client-Secret": node_config.secret,
         }
+        self.headers = {
+            "Content-Type": "application/json",
+        } | headers
+        self.batch_size = node_config.batch_size
+        self.session = requests.Session()
         self.rpc = EthRPC(node_config.node_url, extra_headers=headers)
         self.debug_rpc = DebugRPC(node_config.node_url, extra_headers=headers)
 
-    def eth_get_transaction_by_hash(self, transaction_hash: Hash) -> RemoteTransaction:
+    def _make_batch_request(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Send multiple JSON-RPC requests as batch POSTs and return the results in call
+        order, paying the network round-trip latency only once per batch instead of
+        once per call.
+
+        Batches are capped at `batch_size` items to respect provider limits.
+        """
+        import orjson
+
+        results: List[Any] = []
+        for batch_start in range(0, len(calls), self.batch_size):
+            batch = calls[batch_start : batch_start + self.batch_size]
+            payload = [
+                {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
+                for request_id, (method, params) in enumerate(batch, start=1)
+            ]
+            response = self.session.post(
+                self.node_url, data=orjson.dumps(payload), headers=self.headers
+            )
+            response.raise_for_status()
+            response_by_id = {res["id"]: res for res in orjson.loads(response.content)}
+            for request_id, (method, _) in enumerate(batch, start=1):
+                res = response_by_id[request_id]
+                if "error" in res:
+                    raise Exception(f"Error in batched request {method}: {res['error']}")
+                results.append(res["result"])
+        return results
+
+    def eth_get_transaction_by_hash(self, transaction_hash: "Hash") -> RemoteTransaction:
         """
         Get transaction data.
         """
+        from ethereum_test_types import Transaction
+
         res = self.rpc.get_transaction_by_hash(transaction_hash)
         block_number = res.block_number
         assert block_number is not None, "Transaction does not seem to be included in any block"
@@ -303,26 +364,31 @@ class RequestManager:
             res.ty == 0
         ), f"Transaction has type {res.ty}: Currently only type 0 transactions are supported."
 
+        # The response fields are already validated and typed by
+        # TransactionByHashResponse, so skip re-validating them here.
+        transaction_fields: Dict[str, Any] = dict(
+            ty=res.ty,
+            gas_limit=res.gas_limit,
+            gas_price=res.gas_price,
+            data=res.data,
+            nonce=res.nonce,
+            sender=res.from_address,
+            to=res.to_address,
+            value=res.value,
+            v=res.v,
+            r=res.r,
+            s=res.s,
+            protected=res.v > 30,
+        )
         return RequestManager.RemoteTransaction(
             block_number=block_number,
             tr_hash=res.transaction_hash,
-            transaction=Transaction(
-                ty=res.ty,
-                gas_limit=res.gas_limit,
-                gas_price=res.gas_price,
-                data=res.data,
-                nonce=res.nonce,
-                sender=res.from_address,
-                to=res.to_address,
-                value=res.value,
-                v=res.v,
-                r=res.r,
-                s=res.s,
-                protected=True if res.v > 30 else False,
+            transaction=Transaction.model_construct(
+                _fields_set=set(transaction_fields), **transaction_fields
             ),
         )
 
-    def eth_get_block_by_number(self, block_number: BlockNumberType) -> RemoteBlock:
+    def eth_get_block_by_number(self, block_number: "BlockNumberType") -> RemoteBlock:
         """
         Get block by number
         """
@@ -336,7 +402,7 @@ class RequestManager:
             timestamp=res["timestamp"],
         )
 
-    def debug_trace_call(self, tr: RemoteTransaction) -> Dict[Address, Account]:
+    def debug_trace_call(self, tr: RemoteTransaction) -> "Dict[Address, Account]":
         """
         Get pre-state required for transaction
         """
@@ -349,8 +415,41 @@ class RequestManager:
             f"{tr.block_number}",
         )
 
+    def debug_trace_call_with_block(
+        self, tr: RemoteTransaction
+    ) -> "Tuple[Dict[Address, Account], RemoteBlock]":
+        """
+        Get the pre-state required for the transaction and its block header information
+        using a single JSON-RPC batch request.
+        """
+        trace_call_result, block_result = self._make_batch_request(
+            [
+                (
+                    "debug_traceCall",
+                    [
+                        {
+                            "from": f"{str(tr.transaction.sender)}",
+                            "to": f"{str(tr.transaction.to)}",
+                            "data": f"{str(tr.transaction.data)}",
+                        },
+                        f"{tr.block_number}",
+                        {"tracer": "prestateTracer"},
+                    ],
+                ),
+                ("eth_getBlockByNumber", [hex(tr.block_number), True]),
+            ]
+        )
+        return trace_call_result, RequestManager.RemoteBlock(
+            coinbase=block_result["miner"],
+            number=block_result["number"],
+            difficulty=block_result["difficulty"],
+            gas_limit=block_result["gasLimit"],
+            timestamp=block_result["timestamp"],
+        )
+
 
-PYTEST_TEMPLATE = """
+PYTEST_TEMPLATE = Template(
+    """
 \"\"\"
 $HEADLINE_COMMENT
 \"\"\"
@@ -400,3 +499,4 @@ $TR
     blockchain_test(genesis_environment=env, pre=pre, post=post, blocks=[Block(txs=[tx])])
 
 """
+)
@@ -21,6 +21,7 @@ from .composite_types import Account, Alloc, Storage, StorageRootType
 from .constants import (
     AddrAA,
     AddrBB,
+    EmptyHash,
     EmptyOmmersRoot,
     EmptyTrieRoot,
     TestAddress,
@@ -44,6 +45,7 @@ __all__ = (
     "BLSSignature",
     "Bytes",
     "CamelModel",
+    "EmptyHash",
     "EmptyOmmersRoot",
     "EmptyTrieRoot",
     "FixedSizeBytes",
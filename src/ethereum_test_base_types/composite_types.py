@@ -2,6 +2,7 @@
 Base composite types for Ethereum test cases.
 """
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, ClassVar, Dict, SupportsBytes, Type, TypeAlias
 
 from pydantic import Field, PrivateAttr, RootModel, TypeAdapter
@@ -16,6 +17,31 @@ StorageKeyValueTypeAdapter = TypeAdapter(StorageKeyValueType)
 StorageRootType = Dict[NumberConvertible, NumberConvertible]
 
 
+@lru_cache(maxsize=2**14)
+def _parse_hashable_storage_key_value(
+    value: StorageKeyValueTypeConvertible | StorageKeyValueType,
+) -> StorageKeyValueType:
+    return StorageKeyValueTypeAdapter.validate_python(value)
+
+
+def parse_storage_key_value(
+    value: StorageKeyValueTypeConvertible | StorageKeyValueType,
+) -> StorageKeyValueType:
+    """
+    Parses a storage key or value, caching the result for hashable inputs.
+
+    Storage keys and values repeat heavily across tests, and the pydantic
+    adapter validation is expensive enough to show up in filling times.
+    """
+    try:
+        # The union includes unhashable types (e.g. SupportsBytes), which the
+        # cache cannot accept; they are handled by the TypeError fallback.
+        return _parse_hashable_storage_key_value(value)  # type: ignore[arg-type]
+    except TypeError:
+        # Unhashable inputs (e.g. SupportsBytes) cannot be cached.
+        return StorageKeyValueTypeAdapter.validate_python(value)
+
+
 class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
     """
     Definition of a storage in pre or post state of a test
@@ -114,13 +140,13 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
 
     def __contains__(self, key: StorageKeyValueTypeConvertible | StorageKeyValueType) -> bool:
         """Checks for an item in the storage"""
-        return StorageKeyValueTypeAdapter.validate_python(key) in self.root
+        return parse_storage_key_value(key) in self.root
 
     def __getitem__(
         self, key: StorageKeyValueTypeConvertible | StorageKeyValueType
     ) -> StorageKeyValueType:
         """Returns an item from the storage"""
-        return self.root[StorageKeyValueTypeAdapter.validate_python(key)]
+        return self.root[parse_storage_key_value(key)]
 
     def __setitem__(
         self,
@@ -128,13 +154,11 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         value: StorageKeyValueTypeConvertible | StorageKeyValueType,
     ):  # noqa: SC200
         """Sets an item in the storage"""
-        self.root[
-            StorageKeyValueTypeAdapter.validate_python(key)
-        ] = StorageKeyValueTypeAdapter.validate_python(value)
+        self.root[parse_storage_key_value(key)] = parse_storage_key_value(value)
 
     def __delitem__(self, key: StorageKeyValueTypeConvertible | StorageKeyValueType):
         """Deletes an item from the storage"""
-        del self.root[StorageKeyValueTypeAdapter.validate_python(key)]
+        del self.root[parse_storage_key_value(key)]
 
     def __iter__(self):
         """Returns an iterator over the storage"""
@@ -186,9 +210,9 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         Increments the key counter so the next time this function is called,
         the next key is used.
         """
-        slot = StorageKeyValueTypeAdapter.validate_python(self._current_slot)
+        slot = parse_storage_key_value(self._current_slot)
         self._current_slot += 1
-        self[slot] = StorageKeyValueTypeAdapter.validate_python(value)
+        self[slot] = parse_storage_key_value(value)
         return slot
 
     def peek_slot(self) -> int:
@@ -204,12 +228,11 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         Used for comparison with test expected post state and alloc returned
         by the transition tool.
         """
-        for key in other.keys():
-            if key not in self:
-                return False
-            if self[key] != other[key]:
-                return False
-        return True
+        self_root = self.root
+        other_root = other.root
+        if not other_root.keys() <= self_root.keys():
+            return False
+        return all(self_root[key] == value for key, value in other_root.items())
 
     def must_contain(self, address: Address, other: "Storage"):
         """
@@ -219,14 +242,15 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         by the transition tool.
         Raises detailed exception when a difference is found.
         """
-        for key in other.keys():
-            if key not in self:
+        self_root = self.root
+        for key, value in other.root.items():
+            if key not in self_root:
                 # storage[key]==0 is equal to missing storage
-                if other[key] != 0:
+                if value != 0:
                     raise Storage.MissingKey(key=key)
-            elif self[key] != other[key]:
+            elif self_root[key] != value:
                 raise Storage.KeyValueMismatch(
-                    address=address, key=key, want=self[key], got=other[key]
+                    address=address, key=key, want=self_root[key], got=value
                 )
 
     def must_be_equal(self, address: Address, other: "Storage | None"):
@@ -234,29 +258,33 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         Succeeds only if "self" is equal to "other" storage.
         """
         # Test keys contained in both storage objects
-        if other is None:
-            other = Storage({})
-        for key in self.keys() & other.keys():
-            if self[key] != other[key]:
+        self_root = self.root
+        other_root = other.root if other is not None else {}
+        for key in self_root.keys() & other_root.keys():
+            if self_root[key] != other_root[key]:
                 raise Storage.KeyValueMismatch(
-                    address=address, key=key, want=self[key], got=other[key]
+                    address=address, key=key, want=self_root[key], got=other_root[key]
                 )
 
         # Test keys contained in either one of the storage objects
-        for key in self.keys() ^ other.keys():
-            if key in self:
-                if self[key] != 0:
-                    raise Storage.KeyValueMismatch(address=address, key=key, want=self[key], got=0)
-
-            elif other[key] != 0:
-                raise Storage.KeyValueMismatch(address=address, key=key, want=0, got=other[key])
+        for key in self_root.keys() ^ other_root.keys():
+            if key in self_root:
+                if self_root[key] != 0:
+                    raise Storage.KeyValueMismatch(
+                        address=address, key=key, want=self_root[key], got=0
+                    )
+
+            elif other_root[key] != 0:
+                raise Storage.KeyValueMismatch(
+                    address=address, key=key, want=0, got=other_root[key]
+                )
 
     def canary(self) -> "Storage":
         """
         Returns a canary storage filled with non-zero values where the current storage expects
         zero values, to guarantee that the test overwrites the storage.
         """
-        return Storage({key: HashInt(0xBA5E) for key in self.keys() if self[key] == 0})
+        return Storage({key: HashInt(0xBA5E) for key, value in self.root.items() if value == 0})
 
 
 class Account(CamelModel):
@@ -3,7 +3,7 @@ Exceptions for invalid execution.
 """
 
 from .engine_api import EngineAPIError
-from .evmone_exceptions import EvmoneExceptionMapper
+from .evmone_exceptions import EVMONE_EXCEPTION_MAPPER, EvmoneExceptionMapper
 from .exceptions import (
     BlockException,
     BlockExceptionInstanceOrList,
@@ -15,6 +15,7 @@ from .exceptions import (
 
 __all__ = [
     "BlockException",
+    "EVMONE_EXCEPTION_MAPPER",
     "BlockExceptionInstanceOrList",
     "EngineAPIError",
     "EOFException",
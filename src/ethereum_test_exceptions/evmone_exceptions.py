@@ -3,13 +3,12 @@ Evmone eof exceptions ENUM -> str mapper
 """
 
 from dataclasses import dataclass
-
-from bidict import frozenbidict
+from typing import ClassVar, Dict
 
 from .exceptions import EOFException
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExceptionMessage:
     """Defines a mapping between an exception and a message."""
 
@@ -87,16 +86,16 @@ class EvmoneExceptionMapper:
         ExceptionMessage(EOFException.TOO_MANY_CONTAINERS, "err: too_many_container_sections"),
     )
 
-    def __init__(self) -> None:
-        assert len(set(entry.exception for entry in self._mapping_data)) == len(
-            self._mapping_data
-        ), "Duplicate exception in _mapping_data"
-        assert len(set(entry.message for entry in self._mapping_data)) == len(
-            self._mapping_data
-        ), "Duplicate message in _mapping_data"
-        self.exception_to_message_map: frozenbidict = frozenbidict(
-            {entry.exception: entry.message for entry in self._mapping_data}
-        )
+    # Built once at import time; instantiating the mapper is free.
+    exception_to_message_map: ClassVar[Dict[EOFException, str]] = {
+        entry.exception: entry.message for entry in _mapping_data
+    }
+    message_to_exception_map: ClassVar[Dict[str, EOFException]] = {
+        entry.message: entry.exception for entry in _mapping_data
+    }
+    assert (
+        len(exception_to_message_map) == len(message_to_exception_map) == len(_mapping_data)
+    ), "Duplicate exception or message in _mapping_data"
 
     def exception_to_message(self, exception: EOFException) -> str:
         """Takes an EOFException and returns a formatted string."""
@@ -109,7 +108,14 @@ class EvmoneExceptionMapper:
     def message_to_exception(self, exception_string: str) -> EOFException:
         """Takes a string and tries to find matching exception"""
         # TODO inform tester where to add the missing exception if get uses default
-        exception = self.exception_to_message_map.inverse.get(
+        exception = self.message_to_exception_map.get(
             exception_string, EOFException.UNDEFINED_EXCEPTION
         )
         return exception
+
+
+EVMONE_EXCEPTION_MAPPER = EvmoneExceptionMapper()
+"""
+Shared mapper instance; the mapping tables are class-level so callers can use
+this singleton instead of constructing their own mapper.
+"""
@@ -3,10 +3,10 @@ Base fixture definitions used to define all fixture types.
 """
 
 import hashlib
-import json
 from functools import cached_property
 from typing import Any, ClassVar, Dict
 
+import orjson
 from pydantic import Field
 
 from ethereum_test_base_types import CamelModel, ReferenceSpec
@@ -32,8 +32,12 @@ class BaseFixture(CamelModel):
         """
         Returns the hash of the fixture.
         """
-        json_str = json.dumps(self.json_dict, sort_keys=True, separators=(",", ":"))
-        h = hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+        # orjson with sorted keys emits the same compact canonical form as
+        # json.dumps(..., sort_keys=True, separators=(",", ":")) for the
+        # builtin types produced by model_dump(mode="json"), so fixture
+        # hashes are unchanged.
+        json_bytes = orjson.dumps(self.json_dict, option=orjson.OPT_SORT_KEYS)
+        h = hashlib.sha256(json_bytes).hexdigest()
         return f"0x{h}"
 
     def json_dict_with_info(self, hash_only: bool = False) -> Dict[str, Any]:
@@ -3,14 +3,16 @@ Fixture collector class used to collect, sort and combine the different types of
 fixtures.
 """
 
-import json
 import os
-import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Dict, Literal, Optional, Tuple
 
+import orjson
+
 from ethereum_test_base_types import to_json
 
 from .base import BaseFixture
@@ -18,6 +20,13 @@ from .file import Fixtures
 from .formats import FixtureFormats
 from .verify import FixtureVerifier
 
+PARAMETERS_TRANSLATION_TABLE = str.maketrans({"[": "_", "-": "_", "]": None})
+"""
+Translation table replacing the characters pytest uses in parametrized test
+ids with underscores (dropping the closing bracket), applied in a single
+C-level pass instead of a regex substitution.
+"""
+
 
 def strip_test_prefix(name: str) -> str:
     """
@@ -29,12 +38,16 @@ def strip_test_prefix(name: str) -> str:
     return name
 
 
+@cache
 def get_module_relative_output_dir(test_module: Path, filler_path: Path) -> Path:
     """
     Return a directory name for the provided test_module (relative to the
     base ./tests directory) that can be used for output (within the
     configured fixtures output path or the base_dump_dir directory).
 
+    Cached: this is called once per fixture but only has as many unique inputs
+    as there are test modules, and each call resolves absolute paths.
+
     Example:
     tests/shanghai/eip3855_push0/test_push0.py -> shanghai/eip3855_push0/test_push0
     """
@@ -55,15 +68,25 @@ class TestInfo:
     original_name: str  # pytest: Item.originalname
     path: Path  # pytest: Item.path
 
+    _name_and_parameters: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False)
+
     def get_name_and_parameters(self) -> Tuple[str, str]:
         """
         Converts a test name to a tuple containing the test name and test parameters.
 
+        The result is computed once and memoized; it is requested several times
+        per fixture (basename and dump-dir derivation).
+
         Example:
         test_push0_key_sstore[fork_Shanghai] -> test_push0_key_sstore, fork_Shanghai
         """
-        test_name, parameters = self.name.split("[")
-        return test_name, re.sub(r"[\[\-]", "_", parameters).replace("]", "")
+        if self._name_and_parameters is None:
+            test_name, parameters = self.name.split("[")
+            self._name_and_parameters = (
+                test_name,
+                parameters.translate(PARAMETERS_TRANSLATION_TABLE),
+            )
+        return self._name_and_parameters
 
     def get_single_test_name(self) -> str:
         """
@@ -84,10 +107,11 @@ class TestInfo:
         if not base_dump_dir:
             return None
         test_module_relative_dir = get_module_relative_output_dir(self.path, filler_path)
+        flat_test_module_dir = str(test_module_relative_dir).replace(os.sep, "__")
         if level == "test_module":
-            return Path(base_dump_dir) / Path(str(test_module_relative_dir).replace(os.sep, "__"))
+            return Path(base_dump_dir) / Path(flat_test_module_dir)
         test_name, test_parameter_string = self.get_name_and_parameters()
-        flat_path = f"{str(test_module_relative_dir).replace(os.sep, '__')}__{test_name}"
+        flat_path = f"{flat_test_module_dir}__{test_name}"
         if level == "test_function":
             return Path(base_dump_dir) / flat_path
         elif level == "test_parameter":
@@ -110,10 +134,32 @@ class FixtureCollector:
     # Internal state
     all_fixtures: Dict[Path, Fixtures] = field(default_factory=dict)
     json_path_to_test_item: Dict[Path, TestInfo] = field(default_factory=dict)
+    _fixture_basename_cache: Dict[Tuple[Path, str, Optional[str]], Path] = field(
+        default_factory=dict
+    )
 
     def get_fixture_basename(self, info: TestInfo) -> Path:
         """
         Returns the basename of the fixture file for a given test case.
+
+        When fixtures are grouped by test function, every parametrized case of
+        that function derives the same basename, so the result is cached by the
+        identifying parts of the test info.
+        """
+        cache_key = (
+            info.path,
+            info.original_name,
+            info.name if self.single_fixture_per_file else None,
+        )
+        basename = self._fixture_basename_cache.get(cache_key)
+        if basename is None:
+            basename = self._generate_fixture_basename(info)
+            self._fixture_basename_cache[cache_key] = basename
+        return basename
+
+    def _generate_fixture_basename(self, info: TestInfo) -> Path:
+        """
+        Generates the basename of the fixture file for a given test case.
         """
         if self.flat_output:
             if self.single_fixture_per_file:
@@ -142,11 +188,13 @@ class FixtureCollector:
             / fixture.format.output_base_dir_name
             / fixture_basename.with_suffix(fixture.format.output_file_extension)
         )
-        if fixture_path not in self.all_fixtures.keys():  # relevant when we group by test function
-            self.all_fixtures[fixture_path] = Fixtures(root={})
+        fixtures = self.all_fixtures.get(fixture_path)
+        if fixtures is None:  # relevant when we group by test function
+            fixtures = Fixtures(root={})
+            self.all_fixtures[fixture_path] = fixtures
             self.json_path_to_test_item[fixture_path] = info
 
-        self.all_fixtures[fixture_path][info.id] = fixture
+        fixtures[info.id] = fixture
 
         return fixture_path
 
@@ -158,30 +206,59 @@ class FixtureCollector:
             combined_fixtures = {
                 k: to_json(v) for fixture in self.all_fixtures.values() for k, v in fixture.items()
             }
-            json.dump(combined_fixtures, sys.stdout, indent=4)
+            sys.stdout.buffer.write(orjson.dumps(combined_fixtures, option=orjson.OPT_INDENT_2))
             return
         os.makedirs(self.output_dir, exist_ok=True)
-        for fixture_path, fixtures in self.all_fixtures.items():
-            os.makedirs(fixture_path.parent, exist_ok=True)
-            if len({fixture.format for fixture in fixtures.values()}) != 1:
-                raise TypeError("All fixtures in a single file must have the same format.")
-            fixtures.collect_into_file(fixture_path)
+        # Create each unique parent directory once up front; hundreds of
+        # fixture files can share a parent and a makedirs per file would
+        # repeat the same stat/mkdir syscalls.
+        for parent_dir in {fixture_path.parent for fixture_path in self.all_fixtures}:
+            os.makedirs(parent_dir, exist_ok=True)
+        # Each fixture file is independent, so the serialization and blocking
+        # writes can overlap across a thread pool; list() propagates the first
+        # exception raised by any worker.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            list(executor.map(self._dump_fixtures_to_file, self.all_fixtures.items()))
+
+    def _dump_fixtures_to_file(self, path_and_fixtures: Tuple[Path, Fixtures]) -> None:
+        """
+        Dumps the fixtures of a single output file to disk.
+        """
+        fixture_path, fixtures = path_and_fixtures
+        if len({fixture.format for fixture in fixtures.values()}) != 1:
+            raise TypeError("All fixtures in a single file must have the same format.")
+        fixtures.collect_into_file(fixture_path)
 
     def verify_fixture_files(self, evm_fixture_verification: FixtureVerifier) -> None:
         """
         Runs `evm [state|block]test` on each fixture.
+
+        Each verification shells out to the external `evm` binary, so the
+        independent invocations are spread over a thread pool to keep all
+        cores busy; the worker threads only block on subprocesses.
         """
-        for fixture_path, name_fixture_dict in self.all_fixtures.items():
-            for fixture_name, fixture in name_fixture_dict.items():
-                if FixtureFormats.is_verifiable(fixture.format):
-                    info = self.json_path_to_test_item[fixture_path]
-                    verify_fixtures_dump_dir = self._get_verify_fixtures_dump_dir(info)
-                    evm_fixture_verification.verify_fixture(
-                        fixture.format,
-                        fixture_path,
-                        fixture_name=None,
-                        debug_output_path=verify_fixtures_dump_dir,
-                    )
+        verify_tasks = [
+            (
+                fixture.format,
+                fixture_path,
+                self._get_verify_fixtures_dump_dir(self.json_path_to_test_item[fixture_path]),
+            )
+            for fixture_path, name_fixture_dict in self.all_fixtures.items()
+            for fixture in name_fixture_dict.values()
+            if FixtureFormats.is_verifiable(fixture.format)
+        ]
+
+        def verify_one(task: Tuple[FixtureFormats, Path, Optional[Path]]) -> None:
+            fixture_format, fixture_path, verify_fixtures_dump_dir = task
+            evm_fixture_verification.verify_fixture(
+                fixture_format,
+                fixture_path,
+                fixture_name=None,
+                debug_output_path=verify_fixtures_dump_dir,
+            )
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(verify_one, verify_tasks))
 
     def _get_verify_fixtures_dump_dir(
         self,
@@ -1,10 +1,10 @@
 """
 Defines models for interacting with JSON fixture files.
 """
-import json
 from pathlib import Path
 from typing import Any, Dict, Literal, Optional
 
+import orjson
 from pydantic import RootModel
 
 from .blockchain import EngineFixture as BlockchainEngineFixture
@@ -68,8 +68,8 @@ class BaseFixturesRootModel(RootModel):
         json_fixtures: Dict[str, Dict[str, Any]] = {}
         for name, fixture in self.items():
             json_fixtures[name] = fixture.json_dict_with_info()
-        with open(file_path, "w") as f:
-            json.dump(json_fixtures, f, indent=4)
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(json_fixtures, option=orjson.OPT_INDENT_2))
 
     @classmethod
     def from_file(
@@ -81,8 +81,9 @@ class BaseFixturesRootModel(RootModel):
         Dynamically create a fixture model from the specified json file and,
         optionally, model format.
         """
-        with open(file_path, "r") as f:
-            json_data = json.load(f)
+        # Decode with orjson: fixture files can be tens of MB and the C parser
+        # takes UTF-8 bytes directly, skipping the read-as-text decode pass.
+        json_data = orjson.loads(file_path.read_bytes())
         return cls.from_json_data(json_data, fixture_format)
 
     @classmethod
@@ -2,6 +2,7 @@
 Ethereum blockchain test spec definition and filler.
 """
 
+from functools import cache
 from pprint import pprint
 from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Tuple, Type
 
@@ -12,6 +13,7 @@ from ethereum_test_base_types import (
     Bloom,
     Bytes,
     CamelModel,
+    EmptyHash,
     EmptyOmmersRoot,
     EmptyTrieRoot,
     Hash,
@@ -52,6 +54,24 @@ from evm_transition_tool import TransitionTool
 from .base import BaseTest, verify_result, verify_transactions
 from .debugging import print_traces
 
+DEFAULT_ENVIRONMENT = Environment()
+"""
+Default environment, built once to read default field values from without
+re-validating the whole model; it must never be mutated.
+"""
+
+
+@cache
+def validated_pre_allocation_blockchain(fork: Fork) -> Alloc:
+    """
+    Returns the validated blockchain-test pre-allocation for the given fork.
+
+    Cached because the pre-allocation is a per-fork constant that would
+    otherwise be re-validated for every generated genesis; callers must treat
+    the returned object as read-only (`Alloc.merge` already copies).
+    """
+    return Alloc.model_validate(fork.pre_allocation_blockchain())
+
 
 def environment_from_parent_header(parent: "FixtureHeader") -> "Environment":
     """
@@ -75,18 +95,22 @@ def apply_new_parent(env: Environment, new_parent: FixtureHeader) -> "Environmen
     Applies a header as parent to a copy of this environment.
     """
     updated: Dict[str, Any] = {}
-    updated["parent_difficulty"] = new_parent.difficulty
-    updated["parent_timestamp"] = new_parent.timestamp
-    updated["parent_base_fee_per_gas"] = new_parent.base_fee_per_gas
-    updated["parent_blob_gas_used"] = new_parent.blob_gas_used
-    updated["parent_excess_blob_gas"] = new_parent.excess_blob_gas
-    updated["parent_gas_used"] = new_parent.gas_used
-    updated["parent_gas_limit"] = new_parent.gas_limit
-    updated["parent_ommers_hash"] = new_parent.ommers_hash
+    updated["parent_difficulty"] = Number.or_none(new_parent.difficulty)
+    updated["parent_timestamp"] = Number.or_none(new_parent.timestamp)
+    updated["parent_base_fee_per_gas"] = Number.or_none(new_parent.base_fee_per_gas)
+    updated["parent_blob_gas_used"] = Number.or_none(new_parent.blob_gas_used)
+    updated["parent_excess_blob_gas"] = Number.or_none(new_parent.excess_blob_gas)
+    updated["parent_gas_used"] = Number.or_none(new_parent.gas_used)
+    updated["parent_gas_limit"] = Number.or_none(new_parent.gas_limit)
+    updated["parent_ommers_hash"] = Hash(new_parent.ommers_hash)
     block_hashes = env.block_hashes.copy()
-    block_hashes[new_parent.number] = new_parent.block_hash
+    block_hashes[Number(new_parent.number)] = Hash(new_parent.block_hash)
     updated["block_hashes"] = block_hashes
-    return env.copy(**updated)
+    # The updated values are explicitly coerced to the environment's field
+    # types above, so skip the full re-validation that `copy` would perform.
+    copied: Environment = env.model_copy(update=updated)
+    copied.__dict__.pop("parent_hash", None)  # invalidate the cached property
+    return copied
 
 
 def count_blobs(txs: List[Transaction]) -> int:
@@ -268,20 +292,22 @@ class Block(Header):
         Values that need to be set in the environment and are `None` for
         this block need to be set to their defaults.
         """
-        new_env_values["difficulty"] = self.difficulty
+        new_env_values["difficulty"] = Number.or_none(self.difficulty)
         new_env_values["fee_recipient"] = (
-            self.fee_recipient if self.fee_recipient is not None else Environment().fee_recipient
+            self.fee_recipient
+            if self.fee_recipient is not None
+            else DEFAULT_ENVIRONMENT.fee_recipient
         )
-        new_env_values["gas_limit"] = (
-            self.gas_limit or env.parent_gas_limit or Environment().gas_limit
+        new_env_values["gas_limit"] = Number(
+            self.gas_limit or env.parent_gas_limit or DEFAULT_ENVIRONMENT.gas_limit
         )
         if not isinstance(self.base_fee_per_gas, Removable):
-            new_env_values["base_fee_per_gas"] = self.base_fee_per_gas
+            new_env_values["base_fee_per_gas"] = Number.or_none(self.base_fee_per_gas)
         new_env_values["withdrawals"] = self.withdrawals
         if not isinstance(self.excess_blob_gas, Removable):
-            new_env_values["excess_blob_gas"] = self.excess_blob_gas
+            new_env_values["excess_blob_gas"] = Number.or_none(self.excess_blob_gas)
         if not isinstance(self.blob_gas_used, Removable):
-            new_env_values["blob_gas_used"] = self.blob_gas_used
+            new_env_values["blob_gas_used"] = Number.or_none(self.blob_gas_used)
         if not isinstance(self.parent_beacon_block_root, Removable):
             new_env_values["parent_beacon_block_root"] = self.parent_beacon_block_root
         """
@@ -289,21 +315,26 @@ class Block(Header):
         so they can be calculated here.
         """
         if self.number is not None:
-            new_env_values["number"] = self.number
+            new_env_values["number"] = Number(self.number)
         else:
             # calculate the next block number for the environment
             if len(env.block_hashes) == 0:
-                new_env_values["number"] = 0
+                new_env_values["number"] = Number(0)
             else:
-                new_env_values["number"] = max([Number(n) for n in env.block_hashes.keys()]) + 1
+                # Keys are already validated `Number`s, so compare them directly.
+                new_env_values["number"] = Number(max(env.block_hashes.keys()) + 1)
 
         if self.timestamp is not None:
-            new_env_values["timestamp"] = self.timestamp
+            new_env_values["timestamp"] = Number(self.timestamp)
         else:
             assert env.parent_timestamp is not None
-            new_env_values["timestamp"] = int(Number(env.parent_timestamp) + 12)
+            new_env_values["timestamp"] = Number(int(Number(env.parent_timestamp) + 12))
 
-        return env.copy(**new_env_values)
+        # As above, all values are coerced to the environment's field types,
+        # so the full re-validation performed by `copy` is unnecessary.
+        copied: Environment = env.model_copy(update=new_env_values)
+        copied.__dict__.pop("parent_hash", None)  # invalidate the cached property
+        return copied
 
 
 class BlockchainTest(BaseTest):
@@ -334,16 +365,24 @@ class BlockchainTest(BaseTest):
         assert (
             env.withdrawals is None or len(env.withdrawals) == 0
         ), "withdrawals must be empty at genesis"
-        assert env.parent_beacon_block_root is None or env.parent_beacon_block_root == Hash(
-            0
+        assert (
+            env.parent_beacon_block_root is None or env.parent_beacon_block_root == EmptyHash
         ), "parent_beacon_block_root must be empty at genesis"
 
-        pre_alloc = Alloc.merge(
-            Alloc.model_validate(fork.pre_allocation_blockchain()),
-            self.pre,
-        )
-        if empty_accounts := pre_alloc.empty_accounts():
-            raise Exception(f"Empty accounts in pre state: {empty_accounts}")
+        # Skip the merge entirely when either side is empty; the merge walks
+        # and copies both allocations.
+        fork_pre_alloc = validated_pre_allocation_blockchain(fork)
+        if not self.pre.root:
+            pre_alloc = fork_pre_alloc
+        elif not fork_pre_alloc.root:
+            pre_alloc = self.pre
+        else:
+            pre_alloc = Alloc.merge(fork_pre_alloc, self.pre)
+        if __debug__:
+            # Sanity check over the full pre-allocation; skipped under `python -O`
+            # to keep large production fills from paying the O(N) walk per test
+            if empty_accounts := pre_alloc.empty_accounts():
+                raise Exception(f"Empty accounts in pre state: {empty_accounts}")
         state_root = pre_alloc.state_root()
         genesis = FixtureHeader(
             parent_hash=0,
@@ -12,7 +12,7 @@ from typing import Any, Callable, ClassVar, Generator, List, Optional, Type
 from pydantic import Field, model_validator
 
 from ethereum_test_base_types import Account, Bytes
-from ethereum_test_exceptions import EOFException, EvmoneExceptionMapper
+from ethereum_test_exceptions import EVMONE_EXCEPTION_MAPPER, EOFException
 from ethereum_test_fixtures import BaseFixture, FixtureFormats
 from ethereum_test_fixtures.eof import Fixture, Result, Vector
 from ethereum_test_forks import Fork
@@ -226,7 +226,7 @@ class EOFTest(BaseTest):
         """
         Checks that the reported exception string matches the expected error.
         """
-        parser = EvmoneExceptionMapper()
+        parser = EVMONE_EXCEPTION_MAPPER
         actual_message = result.stdout.strip()
         actual_exception = parser.message_to_exception(actual_message)
 
@@ -2,6 +2,7 @@
 Ethereum state test spec definition and filler.
 """
 
+from functools import cache
 from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Type
 
 from ethereum_test_exceptions import EngineAPIError
@@ -23,6 +24,18 @@ from .debugging import print_traces
 TARGET_BLOB_GAS_PER_BLOCK = 393216
 
 
+@cache
+def validated_pre_allocation(fork: Fork) -> Alloc:
+    """
+    Returns the validated pre-allocation for the given fork.
+
+    Cached because the pre-allocation is a per-fork constant that would
+    otherwise be re-validated for every generated fixture; callers must treat
+    the returned object as read-only (`Alloc.merge` already copies).
+    """
+    return Alloc.model_validate(fork.pre_allocation())
+
+
 class StateTest(BaseTest):
     """
     Filler type that tests transactions over the period of a single block.
@@ -74,23 +87,25 @@ class StateTest(BaseTest):
         """
         Generate the single block that represents this state test in a BlockchainTest format.
         """
-        return [
-            Block(
-                number=self.env.number,
-                timestamp=self.env.timestamp,
-                fee_recipient=self.env.fee_recipient,
-                difficulty=self.env.difficulty,
-                gas_limit=self.env.gas_limit,
-                extra_data=self.env.extra_data,
-                withdrawals=self.env.withdrawals,
-                parent_beacon_block_root=self.env.parent_beacon_block_root,
-                txs=[self.tx],
-                ommers=[],
-                exception=self.tx.error,
-                header_verify=self.blockchain_test_header_verify,
-                rlp_modifier=self.blockchain_test_rlp_modifier,
-            )
-        ]
+        # All values come from the already validated environment and
+        # transaction, so the pydantic validation pass can be skipped;
+        # `Block.set_environment` re-coerces the numeric fields it consumes.
+        block_fields: Dict[str, Any] = dict(
+            number=self.env.number,
+            timestamp=self.env.timestamp,
+            fee_recipient=self.env.fee_recipient,
+            difficulty=self.env.difficulty,
+            gas_limit=self.env.gas_limit,
+            extra_data=self.env.extra_data,
+            withdrawals=self.env.withdrawals,
+            parent_beacon_block_root=self.env.parent_beacon_block_root,
+            txs=[self.tx],
+            ommers=[],
+            exception=self.tx.error,
+            header_verify=self.blockchain_test_header_verify,
+            rlp_modifier=self.blockchain_test_rlp_modifier,
+        )
+        return [Block.model_construct(_fields_set=set(block_fields), **block_fields)]
 
     def generate_blockchain_test(self) -> BlockchainTest:
         """
@@ -119,12 +134,20 @@ class StateTest(BaseTest):
 
         env = self.env.set_fork_requirements(fork)
         tx = self.tx.with_signature_and_sender(keep_secret_key=True)
-        pre_alloc = Alloc.merge(
-            Alloc.model_validate(fork.pre_allocation()),
-            self.pre,
-        )
-        if empty_accounts := pre_alloc.empty_accounts():
-            raise Exception(f"Empty accounts in pre state: {empty_accounts}")
+        # Skip the merge entirely when either side is empty; the merge walks
+        # and copies both allocations.
+        fork_pre_alloc = validated_pre_allocation(fork)
+        if not self.pre.root:
+            pre_alloc = fork_pre_alloc
+        elif not fork_pre_alloc.root:
+            pre_alloc = self.pre
+        else:
+            pre_alloc = Alloc.merge(fork_pre_alloc, self.pre)
+        if __debug__:
+            # Sanity check over the full pre-allocation; skipped under `python -O`
+            # to keep large production fills from paying the O(N) walk per test
+            if empty_accounts := pre_alloc.empty_accounts():
+                raise Exception(f"Empty accounts in pre state: {empty_accounts}")
 
         transition_tool_output = t8n.evaluate(
             alloc=pre_alloc,
@@ -144,7 +167,10 @@ class StateTest(BaseTest):
             raise e
 
         return Fixture(
-            env=FixtureEnvironment(**env.model_dump(exclude_none=True)),
+            # Validate straight from the environment's attributes instead of
+            # dumping it to an intermediate dict first; the validation pass is
+            # still required to re-type the numeric fields for serialization.
+            env=FixtureEnvironment.model_validate(env, from_attributes=True),
             pre=pre_alloc,
             post={
                 fork.blockchain_test_network_name(): [
@@ -6,6 +6,7 @@ import time
 from itertools import count
 from typing import Any, ClassVar, Dict, List, Literal, Union
 
+import orjson
 import requests
 from jwt import encode
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -25,6 +26,14 @@ from .types import (
 
 BlockNumberType = Union[int, Literal["latest", "earliest", "pending"]]
 
+MAX_RESPONSE_SIZE = 512 * 1024 * 1024
+"""
+Maximum accepted JSON-RPC response body size in bytes.
+
+Guards against unexpectedly large responses, e.g. `debug_traceCall` prestates
+of state-heavy transactions, exhausting memory before the JSON parse starts.
+"""
+
 
 class BaseRPC:
     """
@@ -40,6 +49,7 @@ class BaseRPC:
         self.url = url
         self.request_id_counter = count(1)
         self.extra_headers = extra_headers
+        self.session = requests.Session()
 
     def __init_subclass__(cls) -> None:
         """
@@ -68,9 +78,17 @@ class BaseRPC:
         }
         headers = base_header | self.extra_headers | extra_headers
 
-        response = requests.post(self.url, json=payload, headers=headers)
+        response = self.session.post(
+            self.url, data=orjson.dumps(payload), headers=headers, stream=True
+        )
         response.raise_for_status()
-        response_json = response.json()
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and int(content_length) > MAX_RESPONSE_SIZE:
+            raise Exception(
+                f"RPC response to {method} too large: {content_length} bytes "
+                f"(maximum {MAX_RESPONSE_SIZE} bytes)"
+            )
+        response_json = orjson.loads(response.content)
 
         if "error" in response_json:
             exception = JSONRPCError(**response_json["error"])
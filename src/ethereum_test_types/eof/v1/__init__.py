@@ -2,10 +2,14 @@
 EVM Object Format Version 1 Library to generate bytecode for testing purposes
 """
 
+import struct
+from array import array
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from enum import Enum, IntEnum, auto
 from functools import cached_property
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import groupby
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from pydantic import Field, GetCoreSchemaHandler
 from pydantic_core.core_schema import (
@@ -122,6 +126,15 @@ class AutoSection(Enum):
 
 SUPPORT_MULTI_SECTION_HEADER = [SectionKind.CODE, SectionKind.CONTAINER]
 
+_TYPE_DEFINITION_STRUCT = struct.Struct(">BBH")
+"""
+Packer for a serialized type section entry (inputs, outputs, max stack height),
+emitting all three fixed-width fields in a single call.
+"""
+assert _TYPE_DEFINITION_STRUCT.size == (
+    TYPES_INPUTS_BYTE_LENGTH + TYPES_OUTPUTS_BYTE_LENGTH + TYPES_STACK_BYTE_LENGTH
+)
+
 
 class Section(CopyValidateModel):
     """
@@ -189,12 +202,20 @@ class Section(CopyValidateModel):
     Skip section from listing in the types header (not calculating input, output, stack size)
     """
 
+    @cached_property
+    def size(self) -> int:
+        """
+        Size of this section as listed in the header: the custom size when one
+        was explicitly set, otherwise the length of the data.
+        """
+        return self.custom_size if "custom_size" in self.model_fields_set else len(self.data)
+
     @cached_property
     def header(self) -> bytes:
         """
         Get formatted header for this section according to its contents.
         """
-        size = self.custom_size if "custom_size" in self.model_fields_set else len(self.data)
+        size = self.size
         if self.kind == SectionKind.CODE:
             raise Exception("Need container-wide view of code sections to generate header")
         return self.kind.to_bytes(
@@ -228,11 +249,7 @@ class Section(CopyValidateModel):
                     auto_code_outputs,
                 )
 
-        return (
-            code_inputs.to_bytes(length=TYPES_INPUTS_BYTE_LENGTH, byteorder="big")
-            + code_outputs.to_bytes(length=TYPES_OUTPUTS_BYTE_LENGTH, byteorder="big")
-            + max_stack_height.to_bytes(length=TYPES_STACK_BYTE_LENGTH, byteorder="big")
-        )
+        return _TYPE_DEFINITION_STRUCT.pack(code_inputs, code_outputs, max_stack_height)
 
     def with_max_stack_height(self, max_stack_height) -> "Section":
         """
@@ -267,23 +284,17 @@ class Section(CopyValidateModel):
         if sections[0].kind not in SUPPORT_MULTI_SECTION_HEADER:
             return b"".join(s.header for s in sections)
 
-        h = sections[0].kind.to_bytes(HEADER_SECTION_KIND_BYTE_LENGTH, "big")
+        h = bytearray(sections[0].kind.to_bytes(HEADER_SECTION_KIND_BYTE_LENGTH, "big"))
 
-        # Count only those sections that are not marked to be skipped for header calculation
-        header_registered_sections = 0
-        for cs in sections:
-            if not cs.skip_header_listing:
-                header_registered_sections += 1
-
-        h += header_registered_sections.to_bytes(HEADER_SECTION_COUNT_BYTE_LENGTH, "big")
-        for cs in sections:
-            # If section is marked to skip the header calculation, don't make header for it
-            if cs.skip_header_listing:
-                continue
-            size = cs.custom_size if "custom_size" in cs.model_fields_set else len(cs.data)
+        # Gather the sizes of the sections that are not marked to be skipped for
+        # the header calculation; the count of registered sections falls out of
+        # the same pass.
+        sizes = [cs.size for cs in sections if not cs.skip_header_listing]
+        h += len(sizes).to_bytes(HEADER_SECTION_COUNT_BYTE_LENGTH, "big")
+        for size in sizes:
             h += size.to_bytes(HEADER_SECTION_SIZE_BYTE_LENGTH, "big")
 
-        return h
+        return bytes(h)
 
     @classmethod
     def Code(  # noqa: N802
@@ -387,6 +398,12 @@ class Container(CopyValidateModel):
     This allows confirming that raw EOF and Container() representations are identical.
     """
 
+    _DEFAULT_PREFIX: ClassVar[bytes] = bytes(EOF_MAGIC) + bytes(VERSION_NUMBER_BYTES)
+    """
+    Precomputed magic plus version prefix emitted by the overwhelmingly common
+    case where neither field is overridden.
+    """
+
     @cached_property
     def bytecode(self) -> bytes:
         """
@@ -396,74 +413,105 @@ class Container(CopyValidateModel):
             assert len(self.sections) == 0
             return self.raw_bytes
 
-        c = self.magic + self.version
+        # Accumulate into a mutable buffer; repeated `bytes` concatenation would
+        # reallocate the whole container on every append.
+        if "magic" in self.model_fields_set or "version" in self.model_fields_set:
+            c = bytearray(self.magic)
+            c += self.version
+        else:
+            c = bytearray(self._DEFAULT_PREFIX)
 
-        # Prepare auto-generated sections
+        # Prepare auto-generated sections without mutating or copying the
+        # original section list
         sections = self.sections
 
-        # Add type section if needed
-        if self.auto_type_section.any() and count_sections(sections, SectionKind.TYPE) == 0:
+        # Count the sections of each kind in a single pass
+        kind_counts = Counter(s.kind for s in sections)
+
+        # Build the auto type section if needed
+        auto_type_section: Optional[Section] = None
+        if self.auto_type_section.any() and kind_counts[SectionKind.TYPE] == 0:
             # Calculate skipping flags
             types_header_size = 0
-            type_section_data = b""
+            type_section_data = bytearray()
             for s in sections:
                 types_header_size += (
                     len(s.type_definition) if not s.skip_types_header_listing else 0
                 )
-                type_section_data += s.type_definition if not s.skip_types_body_listing else b""
-
-            sections = [
-                Section(
-                    kind=SectionKind.TYPE, data=type_section_data, custom_size=types_header_size
-                )
-            ] + sections
-
-        # Add data section if needed
-        if self.auto_data_section and count_sections(sections, SectionKind.DATA) == 0:
-            sections = sections + [Section(kind=SectionKind.DATA, data="0x")]
+                if not s.skip_types_body_listing:
+                    type_section_data += s.type_definition
+
+            auto_type_section = Section(
+                kind=SectionKind.TYPE,
+                data=bytes(type_section_data),
+                custom_size=types_header_size,
+            )
+
+        # Build the auto data section if needed
+        auto_data_section: Optional[Section] = None
+        if self.auto_data_section and kind_counts[SectionKind.DATA] == 0:
+            auto_data_section = Section(kind=SectionKind.DATA, data="0x")
+
+        # Combine into a single list only when an auto section was generated
+        if auto_type_section is not None or auto_data_section is not None:
+            sections = (
+                ([auto_type_section] if auto_type_section is not None else [])
+                + sections
+                + ([auto_data_section] if auto_data_section is not None else [])
+            )
+
+        # Bucketize the section indices by kind in a single pass; concatenating the
+        # buckets in ascending kind order is equivalent to a stable sort, but the
+        # result can be shared between the header and the body orderings instead of
+        # scanning and sorting the section list twice.
+        if self.auto_sort_sections.any():
+            kind_buckets: Dict[SectionKind | int, List[int]] = defaultdict(list)
+            for i, s in enumerate(sections):
+                kind_buckets[s.kind].append(i)
+            sorted_sections = [
+                sections[i] for kind in sorted(kind_buckets) for i in kind_buckets[kind]
+            ]
+        else:
+            sorted_sections = sections
 
         header_sections = [
             s
-            for s in sections
+            for s in (sorted_sections if self.auto_sort_sections.header() else sections)
             if s.kind != SectionKind.TYPE or self.auto_type_section != AutoSection.ONLY_BODY
         ]
-        if self.auto_sort_sections.header():
-            header_sections.sort(key=lambda x: x.kind)
-
-        # Add headers
-        if header_sections:
-            # Join headers of the same kind in a list of lists, only if they are next to each other
-            concurrent_sections: List[List[Section]] = [[header_sections[0]]]
-            for s in header_sections[1:]:
-                if s.kind == concurrent_sections[-1][-1].kind:
-                    concurrent_sections[-1].append(s)
-                else:
-                    concurrent_sections.append([s])
-            c += b"".join(Section.list_header(cs) for cs in concurrent_sections)
+
+        # Add headers, grouping sections of the same kind into a single header
+        # only if they are next to each other
+        for _, concurrent_sections in groupby(header_sections, key=lambda s: s.kind):
+            c += Section.list_header(list(concurrent_sections))
 
         # Add header terminator
         c += self.header_terminator
 
-        body_sections = sections[:]
-        if self.auto_sort_sections.body():
-            # Sort sections for the body
-            body_sections.sort(key=lambda x: x.kind)
-
-        # Add section bodies
-        for s in body_sections:
-            if s.kind == SectionKind.TYPE and self.auto_type_section == AutoSection.ONLY_HEADER:
-                continue
-            if s.data and not s.skip_body_listing:
-                c += s.data
+        body_sections = sorted_sections if self.auto_sort_sections.body() else sections
+
+        # Add section bodies in one join, letting the C implementation allocate
+        # the combined body with a single correctly-sized copy
+        c += b"".join(
+            s.data
+            for s in body_sections
+            if s.data
+            and not s.skip_body_listing
+            and not (
+                s.kind == SectionKind.TYPE and self.auto_type_section == AutoSection.ONLY_HEADER
+            )
+        )
 
         # Add extra (garbage)
         c += self.extra
 
+        bytecode = bytes(c)
+
         # Check if the constructed bytecode matches the expected one
         if self.expected_bytecode is not None:
-            assert c == self.expected_bytecode
+            assert bytecode == self.expected_bytecode
 
-        return c
+        return bytecode
 
     @classmethod
     def Code(cls, code: BytesConvertible = Bytecode(), **kwargs) -> "Container":  # noqa: N802
@@ -553,10 +601,33 @@ def count_sections(sections: List[Section], kind: SectionKind | int) -> int:
     """
     Counts sections from a list that match a specific kind
     """
-    return len([s for s in sections if s.kind == kind])
+    return sum(1 for s in sections if s.kind == kind)
 
 
-OPCODE_MAP: Dict[int, Op] = {x.int(): x for x in Op}
+OPCODE_MAP: Tuple[Optional[Op], ...] = tuple({x.int(): x for x in Op}.get(i) for i in range(256))
+"""
+Dense opcode lookup table indexed directly by the opcode byte; unassigned
+opcodes map to `None`. Indexing a tuple avoids a dict hash lookup per byte in
+`compute_code_stack_values`.
+"""
+
+_POPPED_STACK_ITEMS = array("i", (0 if op is None else op.popped_stack_items for op in OPCODE_MAP))
+_PUSHED_STACK_ITEMS = array("i", (0 if op is None else op.pushed_stack_items for op in OPCODE_MAP))
+"""
+Per-opcode stack metadata flattened into dense arrays indexed by the opcode
+byte, so the `compute_code_stack_values` inner loop reads plain integers
+instead of performing attribute lookups on `Opcode` instances.
+"""
+
+_STEP_BY_OPCODE = array(
+    "i",
+    (-1 if op is None or op == Op.RJUMPV else 1 + op.data_portion_length for op in OPCODE_MAP),
+)
+"""
+Bytes to advance per opcode: `1 + data_portion_length` for ordinary opcodes,
+with `-1` routing undefined opcodes and the variable-length `RJUMPV` through
+the slow path, keeping the common case branch-free.
+"""
 
 
 def compute_code_stack_values(code: bytes) -> Tuple[int, int, int]:
@@ -568,26 +639,32 @@ def compute_code_stack_values(code: bytes) -> Tuple[int, int, int]:
     """
     i = 0
     stack_height = 0
-    min_stack_height = 0
+    inputs_needed = 0
     max_stack_height = 0
 
     # compute type annotation
     while i < len(code):
-        op = OPCODE_MAP.get(code[i])
-        if op is None:
+        opcode_byte = code[i]
+        step = _STEP_BY_OPCODE[opcode_byte]
+        if step >= 0:
+            i += step
+        elif OPCODE_MAP[opcode_byte] is None:
             return (0, 0, 0)
-        elif op == Op.RJUMPV:
+        else:  # RJUMPV: jump table length is encoded in the code itself
             i += 1
             if i < len(code):
                 count = code[i]
                 i += count * 2
-        else:
-            i += 1 + op.data_portion_length
 
-        stack_height -= op.popped_stack_items
-        min_stack_height = min(stack_height, min_stack_height)
-        stack_height += op.pushed_stack_items
-        max_stack_height = max(stack_height, max_stack_height)
+        # Track the deepest deficit directly as a positive input count and use
+        # plain comparisons; calling min()/max() per opcode is measurably
+        # slower in this loop
+        stack_height -= _POPPED_STACK_ITEMS[opcode_byte]
+        if -stack_height > inputs_needed:
+            inputs_needed = -stack_height
+        stack_height += _PUSHED_STACK_ITEMS[opcode_byte]
+        if stack_height > max_stack_height:
+            max_stack_height = stack_height
     if stack_height < 0:
         stack_height = 0
-    return (abs(min_stack_height), stack_height, max_stack_height)
+    return (inputs_needed, stack_height, max_stack_height)
@@ -685,10 +685,14 @@ class Transaction(TransactionGeneric[HexNumber], TransactionTransitionToolConver
         """
         super().model_post_init(__context)
 
+        # Evaluate the optional fee fields once; they decide both the fee
+        # payment validity and the deduced transaction type.
+        has_max_fee = self.max_fee_per_gas is not None
+        has_max_priority_fee = self.max_priority_fee_per_gas is not None
+        has_max_blob_fee = self.max_fee_per_blob_gas is not None
+
         if self.gas_price is not None and (
-            self.max_fee_per_gas is not None
-            or self.max_priority_fee_per_gas is not None
-            or self.max_fee_per_blob_gas is not None
+            has_max_fee or has_max_priority_fee or has_max_blob_fee
         ):
             raise Transaction.InvalidFeePayment()
 
@@ -696,9 +700,9 @@ class Transaction(TransactionGeneric[HexNumber], TransactionTransitionToolConver
             # Try to deduce transaction type from included fields
             if self.authorization_list is not None:
                 self.ty = 4
-            elif self.max_fee_per_blob_gas is not None or self.blob_kzg_commitments is not None:
+            elif has_max_blob_fee or self.blob_kzg_commitments is not None:
                 self.ty = 3
-            elif self.max_fee_per_gas is not None or self.max_priority_fee_per_gas is not None:
+            elif has_max_fee or has_max_priority_fee:
                 self.ty = 2
             elif self.access_list is not None:
                 self.ty = 1
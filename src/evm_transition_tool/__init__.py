@@ -1,16 +1,36 @@
 """
 Library of Python wrappers for the different implementations of transition tools.
+
+The tool classes are exposed lazily (PEP 562): importing this package only
+loads the abstract `TransitionTool` machinery, and each tool's module is
+imported on first attribute access. `TransitionTool.from_binary_path` imports
+all of them so that binary detection sees every registered subclass.
 """
 
-from .besu import BesuTransitionTool
-from .evmone import EvmOneTransitionTool
-from .execution_specs import ExecutionSpecsTransitionTool
-from .geth import GethTransitionTool
-from .nimbus import NimbusTransitionTool
+from importlib import import_module
+from typing import Any
+
 from .transition_tool import TransitionTool, TransitionToolNotFoundInPath, UnknownTransitionTool
 from .types import Result, TransitionToolOutput
 
-TransitionTool.set_default_tool(GethTransitionTool)
+_TOOL_MODULES = {
+    "BesuTransitionTool": "besu",
+    "EvmOneTransitionTool": "evmone",
+    "ExecutionSpecsTransitionTool": "execution_specs",
+    "GethTransitionTool": "geth",
+    "NimbusTransitionTool": "nimbus",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import and return a tool class from its implementation module on first access.
+    """
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module_name}", __name__), name)
+
 
 __all__ = (
     "BesuTransitionTool",
@@ -137,3 +137,6 @@ class GethTransitionTool(TransitionTool):
         else:
             result_json = []  # there is no parseable format for blocktest output
         return result_json
+
+
+TransitionTool.set_default_tool(GethTransitionTool)
@@ -10,6 +10,7 @@ import tempfile
 import textwrap
 from abc import abstractmethod
 from dataclasses import dataclass, field
+from importlib import import_module
 from itertools import groupby
 from pathlib import Path
 from re import Pattern
@@ -105,12 +106,26 @@ class TransitionTool(FixtureVerifier):
         """
         cls.default_tool = tool_subclass
 
+    @classmethod
+    def load_tool_modules(cls):
+        """
+        Imports all transition tool modules so each subclass registers itself.
+
+        The `evm_transition_tool` package exposes the tool classes lazily to
+        keep its import light; binary detection needs every subclass
+        registered, so all implementation modules are imported here on first
+        use (repeat imports are no-ops via `sys.modules`).
+        """
+        for module_name in ("besu", "evmone", "execution_specs", "geth", "nimbus"):
+            import_module(f".{module_name}", __package__)
+
     @classmethod
     def from_binary_path(cls, *, binary_path: Optional[Path], **kwargs) -> "TransitionTool":
         """
         Instantiates the appropriate TransitionTool subclass derived from the
         tool's binary path.
         """
+        cls.load_tool_modules()
         assert cls.default_tool is not None, "default transition tool was never set"
 
         if binary_path is None:
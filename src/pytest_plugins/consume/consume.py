@@ -217,12 +217,29 @@ def pytest_generate_tests(metafunc):
         metafunc.parametrize("client_type", metafunc.config.hive_execution_clients, ids=client_ids)
 
 
+def _test_case_json_path(item) -> str:
+    """
+    The fixture json path of the item's test case, if any, as a sort key.
+    """
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return ""
+    test_case = callspec.params.get("test_case")
+    return str(getattr(test_case, "json_path", ""))
+
+
 def pytest_collection_modifyitems(session, config, items):
     """
     Modify collected item names to remove the test runner function from the name.
+
+    Additionally, stably sort the collected items by the json path of their
+    test case so that all test cases from one fixture file run back-to-back:
+    this keeps the parsed-fixture cache used by the consume commands hot and
+    guarantees each fixture json file is parsed exactly once per session.
     """
     for item in items:
         original_name = item.originalname
         remove = f"{original_name}["
         if item.name.startswith(remove):
             item.name = item.name[len(remove) : -1]
+    items.sort(key=_test_case_json_path)
@@ -4,7 +4,7 @@ Common pytest fixtures for the RLP and Engine simulators.
 
 import io
 import json
-from typing import Generator, List, cast
+from typing import Dict, Generator, List, cast
 
 import pytest
 import rich
@@ -20,12 +20,31 @@ from pytest_plugins.consume.hive_simulators.ruleset import ruleset  # TODO: gene
 from .timing import TimingData
 
 
+@pytest.fixture(scope="session")
+def eth_rpc_cache() -> Generator[Dict[str, EthRPC], None, None]:
+    """
+    Session-wide cache of ethereum RPC clients keyed by client IP.
+
+    Reusing the client lets consecutive test cases against the same client
+    address share the underlying HTTP session and its pooled connections
+    instead of opening a new TCP connection per test case.
+    """
+    cache: Dict[str, EthRPC] = {}
+    yield cache
+    for eth_rpc in cache.values():
+        eth_rpc.session.close()
+
+
 @pytest.fixture(scope="function")
-def eth_rpc(client: Client) -> EthRPC:
+def eth_rpc(client: Client, eth_rpc_cache: Dict[str, EthRPC]) -> EthRPC:
     """
     Initialize ethereum RPC client for the execution client under test.
     """
-    return EthRPC(ip=client.ip)
+    eth_rpc = eth_rpc_cache.get(client.ip)
+    if eth_rpc is None:
+        eth_rpc = EthRPC(ip=client.ip)
+        eth_rpc_cache[client.ip] = eth_rpc
+    return eth_rpc
 
 
 @pytest.fixture(scope="function")
@@ -0,0 +1,63 @@
+"""
+On-disk cache of parsed fixture json files, shared across pytest-xdist workers.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Type, TypeVar, cast
+
+from ethereum_test_fixtures.file import BaseFixturesRootModel
+
+CACHED_FIXTURES_DIRECTORY = Path(".pytest_fixture_cache")
+
+T = TypeVar("T", bound=BaseFixturesRootModel)
+
+
+def load_fixtures_with_disk_cache(fixture_file_path: Path, fixtures_class: Type[T]) -> T:
+    """
+    Load and parse a fixture json file, backed by a pickle cache on disk.
+
+    With `consume ... -n auto` every xdist worker is a separate process, so a
+    per-process cache still parses each fixture file once per worker.
+    Persisting the parsed model as a pickle keyed by the source file's path,
+    modification time and size lets the first worker that touches a file pay
+    the json decode and pydantic validation cost; every other worker (and any
+    later run over the same fixtures) deserializes the pickle instead.
+
+    The cache is strictly best-effort: any failure to read or write it falls
+    back to parsing the json file directly.
+    """
+    cache_file = None
+    try:
+        stat_result = fixture_file_path.stat()
+        cache_key = (
+            f"{fixture_file_path.resolve()}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+        )
+        digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+        cache_file = CACHED_FIXTURES_DIRECTORY / f"{digest}.pickle"
+        if cache_file.exists():
+            with open(cache_file, "rb") as f:
+                cached_fixtures = pickle.load(f)
+            if isinstance(cached_fixtures, fixtures_class):
+                return cached_fixtures
+    except Exception:
+        pass
+
+    fixtures = cast(T, fixtures_class.from_file(fixture_file_path))
+
+    if cache_file is not None:
+        try:
+            CACHED_FIXTURES_DIRECTORY.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and atomically move it into place so
+            # concurrent workers never observe a partially written pickle.
+            fd, temporary_path = tempfile.mkstemp(dir=CACHED_FIXTURES_DIRECTORY, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(fixtures, f, protocol=5)
+            os.replace(temporary_path, cache_file)
+        except Exception:
+            pass
+
+    return fixtures
@@ -3,6 +3,7 @@ Pytest fixtures and classes for the `consume rlp` hive simulator.
 """
 
 import io
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Mapping, cast
 
@@ -13,10 +14,28 @@ from ethereum_test_fixtures import BlockchainFixture
 from ethereum_test_fixtures.consume import TestCaseIndexFile, TestCaseStream
 from ethereum_test_fixtures.file import BlockchainFixtures
 from pytest_plugins.consume.consume import JsonSource
+from pytest_plugins.consume.hive_simulators.fixture_cache import load_fixtures_with_disk_cache
 
 TestCase = TestCaseIndexFile | TestCaseStream
 
 
+@lru_cache(maxsize=4)
+def load_blockchain_fixtures(fixture_file_path: Path) -> BlockchainFixtures:
+    """
+    Load and parse the fixture json file, memoized by path.
+
+    The `blockchain_fixture` pytest fixture runs once per test case, but a
+    fixture json file typically contains many test cases, so without the cache
+    the same file is re-read and re-validated for every case it contains. The
+    cache is kept small as parsed fixture files can be large; the index file
+    groups the test cases of a file together, so few entries are ever live.
+
+    A second, on-disk cache layer shares the parse cost across pytest-xdist
+    worker processes and repeated runs over the same fixtures.
+    """
+    return load_fixtures_with_disk_cache(fixture_file_path, BlockchainFixtures)
+
+
 @pytest.fixture(scope="module")
 def test_suite_name() -> str:
     """
@@ -50,9 +69,14 @@ def blockchain_fixture(fixture_source: JsonSource, test_case: TestCase) -> Block
         fixture = test_case.fixture
     else:
         assert isinstance(test_case, TestCaseIndexFile), "Expected an index file test case"
-        # TODO: Optimize, json files will be loaded multiple times. This pytest fixture
-        # is executed per test case, and a fixture json will contain multiple test cases.
-        fixtures = BlockchainFixtures.from_file(Path(fixture_source) / test_case.json_path)
+        fixture_file_path = Path(fixture_source) / test_case.json_path
+        # Probe before parsing: a stale index entry would otherwise only be
+        # detected after paying the full parse cost of the fixture file.
+        if not fixture_file_path.exists():
+            pytest.skip(f"Fixture file not found (stale index?): {fixture_file_path}")
+        fixtures = load_blockchain_fixtures(fixture_file_path)
+        if test_case.id not in fixtures:
+            pytest.skip(f"Fixture not present in its file (stale index?): {test_case.id}")
         fixture = fixtures[test_case.id]
     return fixture
 